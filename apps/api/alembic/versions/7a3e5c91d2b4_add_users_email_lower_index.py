@@ -0,0 +1,23 @@
+"""add users email lower index
+
+Revision ID: 7a3e5c91d2b4
+Revises: 645eb3dd0c1b
+Create Date: 2026-10-15 09:12:41.508313
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '7a3e5c91d2b4'
+down_revision = '645eb3dd0c1b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_lower', table_name='users')
@@ -0,0 +1,31 @@
+"""cascade invoice lines on invoice delete
+
+Revision ID: a9d2e7c41f86
+Revises: f3a81c6d5e20
+Create Date: 2026-10-15 14:02:51.337164
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a9d2e7c41f86'
+down_revision = 'f3a81c6d5e20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('invoice_lines_invoice_id_fkey', 'invoice_lines', type_='foreignkey')
+    op.create_foreign_key(
+        'invoice_lines_invoice_id_fkey', 'invoice_lines', 'invoices',
+        ['invoice_id'], ['id'], ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('invoice_lines_invoice_id_fkey', 'invoice_lines', type_='foreignkey')
+    op.create_foreign_key(
+        'invoice_lines_invoice_id_fkey', 'invoice_lines', 'invoices',
+        ['invoice_id'], ['id'],
+    )
@@ -0,0 +1,35 @@
+"""add invoice composite indexes
+
+Revision ID: b58d2e6a4f17
+Revises: e41b0c7f9a62
+Create Date: 2026-10-15 11:26:50.917342
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b58d2e6a4f17'
+down_revision = 'e41b0c7f9a62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_invoices_company_created', 'invoices', ['company_id', 'created_at'], unique=False)
+    op.drop_index('ix_invoices_company_id', table_name='invoices')
+    op.create_index(
+        'ix_invoice_lines_invoice_id_incl',
+        'invoice_lines',
+        ['invoice_id'],
+        unique=False,
+        postgresql_include=['quantity', 'unit_price'],
+    )
+    op.drop_index('ix_invoice_lines_invoice_id', table_name='invoice_lines')
+
+
+def downgrade() -> None:
+    op.create_index('ix_invoice_lines_invoice_id', 'invoice_lines', ['invoice_id'], unique=False)
+    op.drop_index('ix_invoice_lines_invoice_id_incl', table_name='invoice_lines')
+    op.create_index('ix_invoices_company_id', 'invoices', ['company_id'], unique=False)
+    op.drop_index('ix_invoices_company_created', table_name='invoices')
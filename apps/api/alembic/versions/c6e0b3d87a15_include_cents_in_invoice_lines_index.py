@@ -0,0 +1,39 @@
+"""include cents in invoice lines index
+
+Revision ID: c6e0b3d87a15
+Revises: a9d2e7c41f86
+Create Date: 2026-10-15 15:12:07.584236
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c6e0b3d87a15'
+down_revision = 'a9d2e7c41f86'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # INCLUDE columns can't be altered in place; rebuild the covering index so
+    # the *_cents totals path stays an index-only scan too.
+    op.drop_index('ix_invoice_lines_invoice_id_incl', table_name='invoice_lines')
+    op.create_index(
+        'ix_invoice_lines_invoice_id_incl',
+        'invoice_lines',
+        ['invoice_id'],
+        unique=False,
+        postgresql_include=['quantity', 'unit_price', 'quantity_cents', 'unit_price_cents'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_invoice_lines_invoice_id_incl', table_name='invoice_lines')
+    op.create_index(
+        'ix_invoice_lines_invoice_id_incl',
+        'invoice_lines',
+        ['invoice_id'],
+        unique=False,
+        postgresql_include=['quantity', 'unit_price'],
+    )
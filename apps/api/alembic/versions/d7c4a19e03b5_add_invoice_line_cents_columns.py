@@ -0,0 +1,32 @@
+"""add invoice line cents columns
+
+Revision ID: d7c4a19e03b5
+Revises: b58d2e6a4f17
+Create Date: 2026-10-15 12:04:33.681920
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd7c4a19e03b5'
+down_revision = 'b58d2e6a4f17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Stored generated columns: Postgres backfills existing rows while adding
+    # them and keeps them in sync on every insert/update. Both source columns
+    # are NOT NULL, so these are too.
+    op.add_column('invoice_lines', sa.Column(
+        'quantity_cents', sa.BigInteger(), sa.Computed('(quantity * 100)::bigint', persisted=True), nullable=False
+    ))
+    op.add_column('invoice_lines', sa.Column(
+        'unit_price_cents', sa.BigInteger(), sa.Computed('(unit_price * 100)::bigint', persisted=True), nullable=False
+    ))
+
+
+def downgrade() -> None:
+    op.drop_column('invoice_lines', 'unit_price_cents')
+    op.drop_column('invoice_lines', 'quantity_cents')
@@ -0,0 +1,84 @@
+"""use native uuid ids
+
+Revision ID: e41b0c7f9a62
+Revises: 7a3e5c91d2b4
+Create Date: 2026-10-15 10:03:17.224051
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e41b0c7f9a62'
+down_revision = '7a3e5c91d2b4'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs holding UUIDs, parents before children
+UUID_COLUMNS = [
+    ('companies', 'id'),
+    ('users', 'id'),
+    ('memberships', 'id'),
+    ('memberships', 'user_id'),
+    ('memberships', 'company_id'),
+    ('customers', 'id'),
+    ('customers', 'company_id'),
+    ('items', 'id'),
+    ('items', 'company_id'),
+    ('invoices', 'id'),
+    ('invoices', 'company_id'),
+    ('invoices', 'customer_id'),
+    ('invoice_lines', 'id'),
+    ('invoice_lines', 'invoice_id'),
+    ('invoice_lines', 'item_id'),
+]
+
+# (name, source table, local cols, referent table, remote cols, ondelete)
+FOREIGN_KEYS = [
+    ('memberships_user_id_fkey', 'memberships', ['user_id'], 'users', ['id'], 'CASCADE'),
+    ('memberships_company_id_fkey', 'memberships', ['company_id'], 'companies', ['id'], 'CASCADE'),
+    ('customers_company_id_fkey', 'customers', ['company_id'], 'companies', ['id'], None),
+    ('items_company_id_fkey', 'items', ['company_id'], 'companies', ['id'], None),
+    ('invoices_company_id_fkey', 'invoices', ['company_id'], 'companies', ['id'], None),
+    ('invoices_customer_id_fkey', 'invoices', ['customer_id'], 'customers', ['id'], None),
+    ('invoice_lines_invoice_id_fkey', 'invoice_lines', ['invoice_id'], 'invoices', ['id'], None),
+    ('invoice_lines_item_id_fkey', 'invoice_lines', ['item_id'], 'items', ['id'], None),
+]
+
+
+def _drop_foreign_keys() -> None:
+    for name, source, *_ in FOREIGN_KEYS:
+        op.drop_constraint(name, source, type_='foreignkey')
+
+
+def _create_foreign_keys() -> None:
+    for name, source, local_cols, referent, remote_cols, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(name, source, referent, local_cols, remote_cols, ondelete=ondelete)
+
+
+def upgrade() -> None:
+    # FKs must go first: Postgres won't alter one side of a FK to a new type.
+    _drop_foreign_keys()
+    for table, column in UUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.UUID(),
+            existing_type=sa.String(length=36),
+            postgresql_using=f'{column}::uuid',
+        )
+    _create_foreign_keys()
+
+
+def downgrade() -> None:
+    _drop_foreign_keys()
+    for table, column in UUID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=36),
+            existing_type=sa.UUID(),
+            postgresql_using=f'{column}::text',
+        )
+    _create_foreign_keys()
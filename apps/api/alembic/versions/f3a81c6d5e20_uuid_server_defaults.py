@@ -0,0 +1,31 @@
+"""uuid server defaults
+
+Revision ID: f3a81c6d5e20
+Revises: d7c4a19e03b5
+Create Date: 2026-10-15 13:21:08.409517
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f3a81c6d5e20'
+down_revision = 'd7c4a19e03b5'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ['companies', 'users', 'memberships', 'customers', 'items', 'invoices', 'invoice_lines']
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from Postgres 13; pgcrypto provides it on
+    # older servers and is a no-op to enable otherwise.
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.alter_column(table, 'id', server_default=None)
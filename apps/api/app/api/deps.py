@@ -1,9 +1,14 @@
-from typing import Optional
+import threading
+import time
+from hashlib import blake2b
+from typing import Optional, Tuple
+from uuid import UUID
 
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, Header, HTTPException, status
-from jose import JWTError, jwt
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.core.config import settings
 from app.db.session import get_db
@@ -11,6 +16,46 @@ from app.models.user import User
 from app.models.company import Company
 from app.models.membership import Membership
 
+# One round trip for the authenticated user and their company. Outer joins so a
+# user without a membership still resolves (get_current_company rejects it).
+SELECT_USER_AND_COMPANY = (
+    select(User, Company)
+    .outerjoin(Membership, Membership.user_id == User.id)
+    .outerjoin(Company, Company.id == Membership.company_id)
+    .where(User.id == bindparam("user_id"))
+    .limit(1)
+)
+
+# Validated tokens -> (exp, detached User, detached Company | None). Entries live
+# for settings.AUTH_CACHE_TTL_SECONDS, which bounds how long a disabled user or
+# removed membership can still be served from here.
+_auth_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.AUTH_CACHE_TTL_SECONDS)
+
+# Never held in the process-wide cache; loaded from the DB if a route reads it.
+_USER_CACHE_EXCLUDE = frozenset({"password_hash"})
+_auth_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    # Only a local dict key, so a short fast digest is enough.
+    return blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _detached_copy(obj, exclude: frozenset[str] = frozenset()):
+    """Column-only copy of an ORM object that belongs to no session.
+
+    Request sessions expire their objects on commit; caching a copy instead
+    keeps the cached state intact. Callers re-attach it with
+    ``db.merge(copy, load=False)``, which does not emit SQL. Columns in
+    ``exclude`` are left unloaded on the copy.
+    """
+    mapper = inspect(obj).mapper
+    copy = mapper.class_(
+        **{attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs if attr.key not in exclude}
+    )
+    make_transient_to_detached(copy)
+    return copy
+
 
 def _get_bearer_token(authorization: Optional[str]) -> str:
     if not authorization:
@@ -21,41 +66,66 @@ def _get_bearer_token(authorization: Optional[str]) -> str:
     return parts[1].strip()
 
 
-def get_current_user(
+def get_current_user_and_company(
     db: Session = Depends(get_db),
     authorization: Optional[str] = Header(default=None),
-) -> User:
+) -> Tuple[User, Optional[Company]]:
     token = _get_bearer_token(authorization)
+    cache_key = _token_cache_key(token)
+
+    with _auth_cache_lock:
+        cached = _auth_cache.get(cache_key)
+    if cached and cached[0] > time.time():
+        _, cached_user, cached_company = cached
+        company = db.merge(cached_company, load=False) if cached_company else None
+        return db.merge(cached_user, load=False), company
+
     try:
-        payload = jwt.decode(token, settings.API_SECRET_KEY, algorithms=["HS256"])
-    except JWTError:
+        payload = jwt.decode(
+            token,
+            settings.API_SECRET_KEY,
+            algorithms=["HS256"],
+            options={"require": ["sub", "exp"]},
+        )
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user_id = payload.get("sub")
-    if not user_id:
+    try:
+        user_id = UUID(str(payload.get("sub")))
+    except ValueError:
         raise HTTPException(status_code=401, detail="Invalid token subject")
 
-    user = db.get(User, user_id)
-    if not user:
+    row = db.execute(SELECT_USER_AND_COMPANY, {"user_id": user_id}).first()
+    if not row:
         raise HTTPException(status_code=401, detail="User not found")
+    user, company = row
 
     if hasattr(user, "is_active") and not user.is_active:
         raise HTTPException(status_code=403, detail="User is disabled")
 
-    return user
+    entry = (
+        payload["exp"],
+        _detached_copy(user, exclude=_USER_CACHE_EXCLUDE),
+        _detached_copy(company) if company else None,
+    )
+    with _auth_cache_lock:
+        _auth_cache[cache_key] = entry
+
+    return user, company
+
+
+# FastAPI caches dependency results per request (use_cache=True), so routes that
+# depend on both of these still decode the token and hit the DB only once.
+def get_current_user(
+    current: Tuple[User, Optional[Company]] = Depends(get_current_user_and_company, use_cache=True),
+) -> User:
+    return current[0]
 
 
 def get_current_company(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    current: Tuple[User, Optional[Company]] = Depends(get_current_user_and_company, use_cache=True),
 ) -> Company:
-    stmt = (
-        select(Company)
-        .join(Membership, Membership.company_id == Company.id)
-        .where(Membership.user_id == user.id)
-        .limit(1)
-    )
-    company = db.execute(stmt).scalars().first()
+    company = current[1]
     if not company:
         raise HTTPException(status_code=400, detail="User has no company membership")
     return company
@@ -0,0 +1,7 @@
+from typing import Annotated
+
+from pydantic import AfterValidator, EmailStr
+
+# Emails are stored and looked up lower-cased (see ix_users_email_lower), so
+# normalize once in the schema instead of in every route.
+NormalizedEmail = Annotated[EmailStr, AfterValidator(lambda v: v.strip().lower())]
@@ -1,14 +1,21 @@
 from datetime import datetime, timezone
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_company, get_current_user
+from app.api.fields import NormalizedEmail
 from app.core.config import settings
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.security import (
+    create_access_token,
+    dummy_password_hash,
+    hash_password,
+    verify_and_update,
+)
 from app.db.session import get_db
 from app.models.company import Company
 from app.models.membership import Membership
@@ -17,18 +24,20 @@ from app.models.user import User
 # ? No prefix here. Prefix is applied in app/api/router.py
 router = APIRouter(tags=["auth"])
 
+SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 # -----------------------------
 # Schemas
 # -----------------------------
 class RegisterIn(BaseModel):
     company_name: str = Field(min_length=2, max_length=200)
-    email: EmailStr
+    email: NormalizedEmail
     password: str = Field(min_length=8, max_length=72)
 
 
 class LoginIn(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
     password: str = Field(min_length=1, max_length=72)
 
 
@@ -38,9 +47,9 @@ class TokenOut(BaseModel):
 
 
 class MeOut(BaseModel):
-    user_id: str
+    user_id: UUID
     email: EmailStr
-    company_id: str
+    company_id: UUID
     company_name: str
 
 
@@ -54,52 +63,51 @@ def ping():
 
 @router.post("/register", response_model=TokenOut)
 def register(payload: RegisterIn, db: Session = Depends(get_db)):
-    email = str(payload.email).lower().strip()
+    email = payload.email
+    company_name = payload.company_name.strip()
+
+    # Cheap checks first: the password KDF is the expensive part of this route,
+    # so never run it for a request that is going to be rejected anyway.
+    if len(company_name) < 2:
+        raise HTTPException(status_code=422, detail="Company name is too short")
 
-    # email must be unique
-    existing = db.execute(select(User).where(User.email == email)).scalars().first()
-    if existing:
-        raise HTTPException(status_code=409, detail="Email already registered")
-      
     try:
         pw_hash = hash_password(payload.password)
     except ValueError as e:
-        raise HTTPException(status_code=422, detail=str(e)
-        )
+        raise HTTPException(status_code=422, detail=str(e))
 
-    # Create company
-    company = Company(
-        id=str(uuid4()),
-        name=payload.company_name.strip(),
-    )
-    
-    db.add(company)
-
-    # Create user
-    user = User(
-        id=str(uuid4()),
-        email=email,
-        password_hash=hash_password(payload.password),
-        is_active=True,
-        is_superuser=False,
-    )
-
-    db.add(user)
+    company_id = uuid4()
+    user_id = uuid4()
 
-    # Membership (owner)
-    membership = Membership(
-        id=str(uuid4()),
-        company_id=company.id,
-        user_id=user.id,
-        role="owner",
-    )
-
-    db.add(membership)
-
-    db.commit()
+    # Plain Core inserts: nothing here needs the ORM objects afterwards, so skip
+    # identity-map bookkeeping and unit-of-work sorting. One transaction, one commit.
+    try:
+        db.execute(insert(Company).values(id=company_id, name=company_name))
+        db.execute(
+            insert(User).values(
+                id=user_id,
+                email=email,
+                password_hash=pw_hash,
+                is_active=True,
+                is_superuser=False,
+            )
+        )
+        # Membership (owner)
+        db.execute(
+            insert(Membership).values(
+                company_id=company_id,
+                user_id=user_id,
+                role="owner",
+            )
+        )
+        db.commit()
+    except IntegrityError:
+        # email uniqueness is enforced by the DB (ix_users_email_lower)
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Email already registered")
 
     token = create_access_token(
-        subject=user.id,
+        subject=user_id,
         secret_key=settings.API_SECRET_KEY,
         expires_minutes=settings.API_ACCESS_TOKEN_EXPIRE_MINUTES,
     )
@@ -108,18 +116,25 @@ def register(payload: RegisterIn, db: Session = Depends(get_db)):
 
 @router.post("/login", response_model=TokenOut)
 def login(payload: LoginIn, db: Session = Depends(get_db)):
-    email = str(payload.email).lower().strip()
+    email = payload.email
 
-    user = db.execute(select(User).where(User.email == email)).scalars().first()
-    if not user or not getattr(user, "password_hash", None):
-        raise HTTPException(status_code=401, detail="Invalid email or password")
+    user = db.execute(SELECT_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
+    stored_hash = getattr(user, "password_hash", None) if user else None
 
-    if not verify_password(payload.password, user.password_hash):
+    # Always do the same hashing work, against a dummy hash when there is no
+    # real one, so response time does not reveal whether the email is registered.
+    password_ok, new_hash = verify_and_update(payload.password, stored_hash or dummy_password_hash())
+    if not stored_hash or not password_ok:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     if hasattr(user, "is_active") and not user.is_active:
         raise HTTPException(status_code=403, detail="User is disabled")
 
+    # Upgrade legacy bcrypt / outdated Argon2 hashes now that we have the password.
+    if new_hash:
+        user.password_hash = new_hash
+        db.commit()
+
     token = create_access_token(
         subject=user.id,
         secret_key=settings.API_SECRET_KEY,
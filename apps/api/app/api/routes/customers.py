@@ -1,22 +1,29 @@
 from typing import List, Optional
-from uuid import uuid4
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_company, get_current_user
+from app.api.fields import NormalizedEmail
 from app.db.session import get_db
 from app.models.company import Company
 from app.models.customer import Customer
 
 router = APIRouter(prefix="/customers", tags=["customers"])
 
+SELECT_CUSTOMERS_FOR_COMPANY = (
+    select(Customer)
+    .where(Customer.company_id == bindparam("company_id"))
+    .order_by(Customer.name.asc())
+)
+
 
 class CustomerCreate(BaseModel):
     name: str = Field(min_length=1, max_length=200)
-    email: Optional[EmailStr] = None
+    email: Optional[NormalizedEmail] = None
     phone: Optional[str] = None
 
     address1: Optional[str] = None
@@ -29,7 +36,7 @@ class CustomerCreate(BaseModel):
 
 class CustomerUpdate(BaseModel):
     name: Optional[str] = Field(default=None, min_length=1, max_length=200)
-    email: Optional[EmailStr] = None
+    email: Optional[NormalizedEmail] = None
     phone: Optional[str] = None
 
     address1: Optional[str] = None
@@ -41,7 +48,7 @@ class CustomerUpdate(BaseModel):
 
 
 class CustomerOut(BaseModel):
-    id: str
+    id: UUID
     name: str
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
@@ -63,8 +70,7 @@ def list_customers(
     company: Company = Depends(get_current_company),
     _user=Depends(get_current_user),
 ):
-    stmt = select(Customer).where(Customer.company_id == company.id).order_by(Customer.name.asc())
-    return db.execute(stmt).scalars().all()
+    return db.execute(SELECT_CUSTOMERS_FOR_COMPANY, {"company_id": company.id}).scalars().all()
 
 
 @router.post("", response_model=CustomerOut)
@@ -75,10 +81,9 @@ def create_customer(
     _user=Depends(get_current_user),
 ):
     customer = Customer(
-        id=str(uuid4()),
         company_id=company.id,
         name=payload.name.strip(),
-        email=str(payload.email).lower().strip() if payload.email else None,
+        email=payload.email,
         phone=payload.phone,
         address1=payload.address1,
         address2=payload.address2,
@@ -95,7 +100,7 @@ def create_customer(
 
 @router.get("/{customer_id}", response_model=CustomerOut)
 def get_customer(
-    customer_id: str,
+    customer_id: UUID,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
     _user=Depends(get_current_user),
@@ -108,7 +113,7 @@ def get_customer(
 
 @router.put("/{customer_id}", response_model=CustomerOut)
 def update_customer(
-    customer_id: str,
+    customer_id: UUID,
     payload: CustomerUpdate,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
@@ -119,8 +124,6 @@ def update_customer(
         raise HTTPException(status_code=404, detail="Customer not found")
 
     for k, v in payload.model_dump(exclude_unset=True).items():
-        if k == "email" and v is not None:
-            v = str(v).lower().strip()
         setattr(customer, k, v)
 
     db.commit()
@@ -128,9 +131,9 @@ def update_customer(
     return customer
 
 
-@router.delete("/{customer_id}")
+@router.delete("/{customer_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_customer(
-    customer_id: str,
+    customer_id: UUID,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
     _user=Depends(get_current_user),
@@ -141,4 +144,4 @@ def delete_customer(
 
     db.delete(customer)
     db.commit()
-    return {"deleted": True}
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
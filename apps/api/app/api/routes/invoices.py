@@ -1,12 +1,13 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
-from uuid import uuid4
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, selectinload
 
 from app.api.deps import get_current_company
 from app.db.session import get_db
@@ -22,19 +23,28 @@ router = APIRouter(prefix="/invoices", tags=["invoices"])
 # -----------------------------
 # Helpers / rules
 # -----------------------------
-ALLOWED_STATUSES = {"draft", "sent", "paid", "void"}
-
-# Allowed transitions:
+# Allowed transitions (the keys are also the set of valid statuses):
 # draft -> sent/void
 # sent  -> paid/void
 # paid  -> (no changes)
 # void  -> (no changes)
-ALLOWED_TRANSITIONS = {
-    "draft": {"sent", "void"},
-    "sent": {"paid", "void"},
-    "paid": set(),
-    "void": set(),
-}
+ALLOWED_TRANSITIONS: Mapping[str, FrozenSet[str]] = MappingProxyType(
+    {
+        "draft": frozenset({"sent", "void"}),
+        "sent": frozenset({"paid", "void"}),
+        "paid": frozenset(),
+        "void": frozenset(),
+    }
+)
+
+# Hot statements, built once so SQLAlchemy's compiled cache is hit on every call.
+# Primary-key lookups go through db.get() instead, which checks the session's
+# identity map (our per-request cache) before emitting any SQL.
+SELECT_INVOICES_FOR_COMPANY = (
+    select(Invoice)
+    .where(Invoice.company_id == bindparam("company_id"))
+    .order_by(Invoice.created_at.desc())
+)
 
 
 def _ensure_company_invoice(invoice: Invoice, company: Company):
@@ -51,15 +61,16 @@ def _ensure_editable(invoice: Invoice):
         )
 
 
-def _get_invoice(db: Session, invoice_id: str) -> Invoice:
-    inv = db.execute(select(Invoice).where(Invoice.id == invoice_id)).scalars().first()
+def _get_invoice(db: Session, invoice_id: UUID, load_lines: bool = False) -> Invoice:
+    options = [selectinload(Invoice.lines)] if load_lines else None
+    inv = db.get(Invoice, invoice_id, options=options)
     if not inv:
         raise HTTPException(status_code=404, detail="Invoice not found")
     return inv
 
 
-def _get_line(db: Session, line_id: str) -> InvoiceLine:
-    line = db.execute(select(InvoiceLine).where(InvoiceLine.id == line_id)).scalars().first()
+def _get_line(db: Session, line_id: UUID) -> InvoiceLine:
+    line = db.get(InvoiceLine, line_id)
     if not line:
         raise HTTPException(status_code=404, detail="Invoice line not found")
     return line
@@ -69,7 +80,7 @@ def _get_line(db: Session, line_id: str) -> InvoiceLine:
 # Schemas
 # -----------------------------
 class InvoiceCreate(BaseModel):
-    customer_id: str
+    customer_id: UUID
     number: Optional[str] = None
     tax_rate: Decimal = Field(default=Decimal("0.0000"))
     currency: str = Field(default="USD", max_length=10)
@@ -77,7 +88,7 @@ class InvoiceCreate(BaseModel):
 
 
 class InvoiceUpdate(BaseModel):
-    customer_id: Optional[str] = None
+    customer_id: Optional[UUID] = None
     number: Optional[str] = None
     tax_rate: Optional[Decimal] = None
     currency: Optional[str] = Field(default=None, max_length=10)
@@ -85,9 +96,9 @@ class InvoiceUpdate(BaseModel):
 
 
 class InvoiceOut(BaseModel):
-    id: str
-    company_id: str
-    customer_id: str
+    id: UUID
+    company_id: UUID
+    customer_id: UUID
     number: Optional[str]
     tax_rate: Decimal
     subtotal: Decimal
@@ -104,16 +115,16 @@ class InvoiceOut(BaseModel):
 
 
 class InvoiceLineCreate(BaseModel):
-    item_id: Optional[str] = None
+    item_id: Optional[UUID] = None
     description: Optional[str] = None
     quantity: Decimal = Field(gt=Decimal("0.00"))
     unit_price: Optional[Decimal] = None  # if item_id provided and unit_price omitted, we snapshot from item
 
 
 class InvoiceLineOut(BaseModel):
-    id: str
-    invoice_id: str
-    item_id: Optional[str]
+    id: UUID
+    invoice_id: UUID
+    item_id: Optional[UUID]
     description: Optional[str]
     quantity: Decimal
     unit_price: Decimal
@@ -141,9 +152,7 @@ def list_invoices(
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
 ):
-    invoices = db.execute(
-        select(Invoice).where(Invoice.company_id == company.id).order_by(Invoice.created_at.desc())
-    ).scalars().all()
+    invoices = db.execute(SELECT_INVOICES_FOR_COMPANY, {"company_id": company.id}).scalars().all()
     return invoices
 
 
@@ -154,14 +163,11 @@ def create_invoice(
     company: Company = Depends(get_current_company),
 ):
     # Ensure customer exists and belongs to company
-    cust = db.execute(
-        select(Customer).where(Customer.id == payload.customer_id, Customer.company_id == company.id)
-    ).scalars().first()
-    if not cust:
+    cust = db.get(Customer, payload.customer_id)
+    if not cust or cust.company_id != company.id:
         raise HTTPException(status_code=404, detail="Customer not found")
 
     inv = Invoice(
-        id=str(uuid4()),
         company_id=company.id,
         customer_id=payload.customer_id,
         number=payload.number,
@@ -178,24 +184,18 @@ def create_invoice(
 
 @router.get("/{invoice_id}", response_model=InvoiceWithLinesOut)
 def get_invoice(
-    invoice_id: str,
+    invoice_id: UUID,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
 ):
-    inv = _get_invoice(db, invoice_id)
+    inv = _get_invoice(db, invoice_id, load_lines=True)
     _ensure_company_invoice(inv, company)
-
-    # load lines
-    lines = db.execute(
-        select(InvoiceLine).where(InvoiceLine.invoice_id == inv.id)
-    ).scalars().all()
-    inv.lines = lines  # for response model
     return inv
 
 
 @router.put("/{invoice_id}", response_model=InvoiceOut)
 def update_invoice(
-    invoice_id: str,
+    invoice_id: UUID,
     payload: InvoiceUpdate,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
@@ -205,10 +205,8 @@ def update_invoice(
     _ensure_editable(inv)
 
     if payload.customer_id is not None:
-        cust = db.execute(
-            select(Customer).where(Customer.id == payload.customer_id, Customer.company_id == company.id)
-        ).scalars().first()
-        if not cust:
+        cust = db.get(Customer, payload.customer_id)
+        if not cust or cust.company_id != company.id:
             raise HTTPException(status_code=404, detail="Customer not found")
         inv.customer_id = payload.customer_id
 
@@ -227,7 +225,6 @@ def update_invoice(
     # if tax_rate changed, totals should update
     recalc_invoice_totals(db, inv.id)
 
-    db.add(inv)
     db.commit()
     db.refresh(inv)
     return inv
@@ -235,7 +232,7 @@ def update_invoice(
 
 @router.delete("/{invoice_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_invoice(
-    invoice_id: str,
+    invoice_id: UUID,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
 ):
@@ -243,6 +240,7 @@ def delete_invoice(
     _ensure_company_invoice(inv, company)
     _ensure_editable(inv)
 
+    # Lines go with it via ON DELETE CASCADE (see Invoice.lines).
     db.delete(inv)
     db.commit()
     return None
@@ -253,7 +251,7 @@ def delete_invoice(
 # -----------------------------
 @router.post("/{invoice_id}/lines", response_model=InvoiceOut, status_code=status.HTTP_201_CREATED)
 def add_invoice_line(
-    invoice_id: str,
+    invoice_id: UUID,
     payload: InvoiceLineCreate,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
@@ -266,14 +264,12 @@ def add_invoice_line(
 
     # If item_id provided and unit_price omitted, snapshot item.unit_price
     if payload.item_id:
-        item = db.execute(
-            select(Item).where(Item.id == payload.item_id, Item.company_id == company.id)
-        ).scalars().first()
-        if not item:
+        item = db.get(Item, payload.item_id)
+        if not item or item.company_id != company.id:
             raise HTTPException(status_code=404, detail="Item not found")
 
         if unit_price is None:
-            unit_price = Decimal(str(item.unit_price))
+            unit_price = item.unit_price  # Numeric column: already a Decimal
 
         if payload.description is None:
             payload.description = item.name
@@ -282,7 +278,6 @@ def add_invoice_line(
         raise HTTPException(status_code=422, detail="unit_price is required when item_id is not provided")
 
     line = InvoiceLine(
-        id=str(uuid4()),
         invoice_id=inv.id,
         item_id=payload.item_id,
         description=payload.description,
@@ -300,10 +295,10 @@ def add_invoice_line(
     return inv
 
 
-@router.delete("/{invoice_id}/lines/{line_id}")
+@router.delete("/{invoice_id}/lines/{line_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_invoice_line(
-    invoice_id: str,
-    line_id: str,
+    invoice_id: UUID,
+    line_id: UUID,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
 ):
@@ -321,7 +316,7 @@ def delete_invoice_line(
     recalc_invoice_totals(db, inv.id)
 
     db.commit()
-    return {"ok": True}
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 # -----------------------------
@@ -329,14 +324,14 @@ def delete_invoice_line(
 # -----------------------------
 @router.post("/{invoice_id}/status", response_model=InvoiceOut)
 def set_invoice_status(
-    invoice_id: str,
+    invoice_id: UUID,
     payload: StatusChangeIn,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
 ):
     new_status = payload.status.strip().lower()
 
-    if new_status not in ALLOWED_STATUSES:
+    if new_status not in ALLOWED_TRANSITIONS:
         raise HTTPException(status_code=422, detail=f"Invalid status: {new_status}")
 
     inv = _get_invoice(db, invoice_id)
@@ -347,8 +342,8 @@ def set_invoice_status(
     if new_status == current:
         return inv
 
-    allowed = ALLOWED_TRANSITIONS.get(current, set())
-    if new_status not in allowed:
+    allowed = ALLOWED_TRANSITIONS.get(current)
+    if allowed is None or new_status not in allowed:
         raise HTTPException(
             status_code=409,
             detail=f"Invalid transition: {current} -> {new_status}",
@@ -358,7 +353,6 @@ def set_invoice_status(
     recalc_invoice_totals(db, inv.id)
 
     inv.status = new_status
-    db.add(inv)
     db.commit()
     db.refresh(inv)
     return inv
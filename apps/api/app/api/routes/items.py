@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Response
 from pydantic import BaseModel, ConfigDict, Field
@@ -45,8 +46,8 @@ class ItemUpdate(BaseModel):
 class ItemOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    id: str
-    company_id: str
+    id: UUID
+    company_id: UUID
     name: str
     sku: Optional[str]
     description: Optional[str]
@@ -59,10 +60,10 @@ class ItemOut(BaseModel):
 # -----------------------------
 # Helpers
 # -----------------------------
-def _get_item_or_404(db: Session, company_id: str, item_id: str) -> Item:
-    stmt = select(Item).where(Item.id == item_id, Item.company_id == company_id)
-    item = db.execute(stmt).scalar_one_or_none()
-    if not item:
+def _get_item_or_404(db: Session, company_id: UUID, item_id: UUID) -> Item:
+    # db.get() hits the session identity map first, so repeat lookups are free.
+    item = db.get(Item, item_id)
+    if not item or item.company_id != company_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
     return item
 
@@ -108,7 +109,7 @@ def create_item(
 
 @router.get("/{item_id}", response_model=ItemOut)
 def get_item(
-    item_id: str,
+    item_id: UUID,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
 ) -> Item:
@@ -117,7 +118,7 @@ def get_item(
 
 @router.put("/{item_id}", response_model=ItemOut)
 def update_item(
-    item_id: str,
+    item_id: UUID,
     payload: ItemUpdate,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
@@ -144,17 +145,11 @@ def update_item(
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_item(
-    item_id: str,
+    item_id: UUID,
     db: Session = Depends(get_db),
     company: Company = Depends(get_current_company),
 ):
-    item = (
-        db.query(Item)
-        .filter(Item.id == item_id, Item.company_id == company.id)
-        .first()
-    )
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
+    item = _get_item_or_404(db, company.id, item_id)
 
     db.delete(item)
     db.commit()
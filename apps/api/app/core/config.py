@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -15,17 +17,48 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = Field(default="db", alias="POSTGRES_HOST")
     POSTGRES_PORT: int = Field(default=5432, alias="POSTGRES_PORT")
 
+    # App engine pool (alembic keeps its own NullPool engine)
+    DB_POOL_SIZE: int = Field(default=20, alias="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    DB_POOL_RECYCLE_SECONDS: int = Field(default=1800, alias="DB_POOL_RECYCLE_SECONDS")
+    # psycopg prepares a statement server-side after this many executions on a
+    # connection (5 is psycopg's own default). -1 disables prepared statements,
+    # which pgbouncer in transaction pooling mode requires.
+    DB_PREPARE_THRESHOLD: int = Field(default=5, alias="DB_PREPARE_THRESHOLD")
+
+    # Sum invoice lines from the bigint *_cents columns instead of numeric
+    INVOICE_TOTALS_FROM_CENTS: bool = Field(default=False, alias="INVOICE_TOTALS_FROM_CENTS")
+
     # --- Security ---
     API_SECRET_KEY: str = Field(default="super-secret-change-me-now", alias="API_SECRET_KEY")
     API_ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=10080, alias="API_ACCESS_TOKEN_EXPIRE_MINUTES")
 
+    # How long a validated token's user/company stay cached in-process; also the
+    # longest a disabled user or removed membership can keep being accepted.
+    AUTH_CACHE_TTL_SECONDS: int = Field(default=30, alias="AUTH_CACHE_TTL_SECONDS")
+
+    # Argon2id cost. Hashing dominates /auth/register and /auth/login, and its
+    # CPU time and RAM scale with these. Defaults are the OWASP baseline
+    # (46 MiB, t=3, p=1); lower them only for a measured latency budget, since
+    # every step down makes offline guessing cheaper by the same factor.
+    PASSWORD_HASH_TIME_COST: int = Field(default=3, alias="PASSWORD_HASH_TIME_COST")
+    PASSWORD_HASH_MEMORY_KIB: int = Field(default=46 * 1024, alias="PASSWORD_HASH_MEMORY_KIB")
+    PASSWORD_HASH_PARALLELISM: int = Field(default=1, alias="PASSWORD_HASH_PARALLELISM")
+
+    # Cost of the legacy bcrypt hashes still in the users table. Every login
+    # also spends one bcrypt check at this cost so its timing does not reveal
+    # which kind of hash an account has; set to 0 once all accounts have been
+    # rehashed to Argon2 on login.
+    PASSWORD_LEGACY_BCRYPT_ROUNDS: int = Field(default=12, alias="PASSWORD_LEGACY_BCRYPT_ROUNDS")
+
     # --- CORS ---
     # .env uses: API_CORS_ORIGINS=http://localhost:5173,http://localhost
     API_CORS_ORIGINS: str = Field(default="http://localhost:5173,http://localhost", alias="API_CORS_ORIGINS")
 
-    @property
-    def CORS_ORIGINS(self) -> list[str]:
-        return [o.strip() for o in self.API_CORS_ORIGINS.split(",") if o.strip()]
+    @cached_property
+    def CORS_ORIGINS(self) -> frozenset[str]:
+        # CORSMiddleware checks `origin in allow_origins` on every request.
+        return frozenset(o.strip() for o in self.API_CORS_ORIGINS.split(",") if o.strip())
 
     @property
     def database_url(self) -> str:
@@ -1,39 +1,142 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import hmac
+import time
+from functools import lru_cache
 from typing import Any, Optional
 
+import bcrypt
 import jwt
-from passlib.context import CryptContext
+import orjson
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
 
-# bcrypt only uses the first 72 bytes of input. Passlib raises if >72 bytes.
+
+@lru_cache(maxsize=1)
+def _password_hasher() -> PasswordHasher:
+    # Argon2id; cost is configurable, see PASSWORD_HASH_* in config. Built on
+    # first use rather than at import.
+    return PasswordHasher(
+        time_cost=settings.PASSWORD_HASH_TIME_COST,
+        memory_cost=settings.PASSWORD_HASH_MEMORY_KIB,
+        parallelism=settings.PASSWORD_HASH_PARALLELISM,
+        hash_len=32,
+        salt_len=16,
+        type=Type.ID,
+    )
+
+
+# Verified against when there is no real hash (unknown login email), so the
+# request still costs one KDF. Computed on first use: an Argon2 hash at import
+# time would slow every worker start.
+@lru_cache(maxsize=1)
+def dummy_password_hash() -> str:
+    return hash_password("not-a-real-password-\x00-sentinel")
+
+
+# Accounts created before the Argon2 switch still carry bcrypt hashes; those are
+# checked with pyca/bcrypt directly.
+# bcrypt only uses the first 72 bytes of input; we reject longer input rather
+# than silently truncating it.
 BCRYPT_MAX_BYTES = 72
+ARGON2_PREFIX = "$argon2"
 
 
 def _check_bcrypt_length(password: str) -> None:
     if password is None:
         raise ValueError("Password is required")
-    pw_bytes = password.encode("utf-8")
-    if len(pw_bytes) > BCRYPT_MAX_BYTES:
-        raise ValueError(
-            f"Password too long for bcrypt: {len(pw_bytes)} bytes (max {BCRYPT_MAX_BYTES})."
-        )
+    # A UTF-8 character is 1-4 bytes, so the character count alone settles
+    # most inputs without encoding a throwaway copy.
+    n = len(password)
+    if n <= BCRYPT_MAX_BYTES // 4:
+        return
+    if n <= BCRYPT_MAX_BYTES:
+        n = len(password.encode("utf-8"))
+    if n > BCRYPT_MAX_BYTES:
+        raise ValueError(f"Password too long for bcrypt (max {BCRYPT_MAX_BYTES} bytes).")
+
+
+@lru_cache(maxsize=1)
+def _legacy_bcrypt_dummy() -> Optional[bytes]:
+    rounds = settings.PASSWORD_LEGACY_BCRYPT_ROUNDS
+    return bcrypt.hashpw(b"not-a-real-password", bcrypt.gensalt(rounds)) if rounds else None
+
+
+def _legacy_bcrypt_pad() -> None:
+    # One bcrypt check's worth of work, for paths that would otherwise skip it.
+    dummy = _legacy_bcrypt_dummy()
+    if dummy is not None:
+        bcrypt.checkpw(b"not-a-real-password", dummy)
 
 
 def hash_password(password: str) -> str:
-    _check_bcrypt_length(password)
-    return pwd_context.hash(password)
+    if password is None:
+        raise ValueError("Password is required")
+    return _password_hasher().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if hashed_password.startswith(ARGON2_PREFIX):
+        try:
+            return _password_hasher().verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    # Legacy bcrypt hash.
     # If a user enters something >72 bytes, don't crash; just fail auth.
     try:
         _check_bcrypt_length(plain_password)
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
     except ValueError:
+        _legacy_bcrypt_pad()
         return False
-    return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password for login and return (ok, new_hash).
+    - new_hash is set when ok and the stored hash is legacy bcrypt or uses
+      outdated Argon2 parameters; the caller should store it.
+    - Every path costs one Argon2 and one bcrypt operation (see
+      PASSWORD_LEGACY_BCRYPT_ROUNDS), so timing does not reveal whether an
+      account exists or which kind of hash it has.
+    """
+    if hashed_password.startswith(ARGON2_PREFIX):
+        ok = verify_password(plain_password, hashed_password)
+        _legacy_bcrypt_pad()
+        if ok and _password_hasher().check_needs_rehash(hashed_password):
+            return True, hash_password(plain_password)
+        return ok, None
+
+    if verify_password(plain_password, hashed_password):
+        return True, hash_password(plain_password)
+    # Same Argon2 work as the rehash above.
+    verify_password(plain_password, dummy_password_hash())
+    return False, None
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+@lru_cache(maxsize=8)
+def _hs256_signing_parts(secret_key: str) -> tuple[bytes, "hmac.HMAC"]:
+    # The JWS header and keyed HMAC state never change for a given secret;
+    # callers copy() the template instead of re-deriving the pads per token.
+    header = _b64url(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+    return header, hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _hs256_encode(payload: dict[str, Any], secret_key: str) -> str:
+    header, template = _hs256_signing_parts(secret_key)
+    signing_input = header + b"." + _b64url(orjson.dumps(payload))
+    mac = template.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
 
 
 def create_access_token(
@@ -47,15 +150,20 @@ def create_access_token(
     Create a JWT access token.
     - subject: typically the user_id
     """
-    now = datetime.now(timezone.utc)
-    exp = now + timedelta(minutes=int(expires_minutes))
+    now = int(time.time())
 
     payload: dict[str, Any] = {
         "sub": str(subject),
-        "iat": int(now.timestamp()),
-        "exp": int(exp.timestamp()),
+        "iat": now,
+        "exp": now + int(expires_minutes) * 60,
     }
     if additional_claims:
         payload.update(additional_claims)
+    elif algorithm == "HS256":
+        # Fast path for our own tokens: all claims are JSON-native, so skip
+        # PyJWT's per-call header/serializer/algorithm dispatch. Output is a
+        # standard HS256 JWT that jwt.decode verifies as usual.
+        return _hs256_encode(payload, secret_key)
 
+    # Arbitrary extra claims (e.g. datetimes) get PyJWT's claim handling.
     return jwt.encode(payload, secret_key, algorithm=algorithm)
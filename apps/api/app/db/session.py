@@ -1,9 +1,27 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+connect_args = {}
+if make_url(settings.database_url).drivername == "postgresql+psycopg":
+    # psycopg3: None turns server-side prepared statements off
+    threshold = settings.DB_PREPARE_THRESHOLD
+    connect_args["prepare_threshold"] = None if threshold < 0 else threshold
+
+# Hot CRUD statements are module-level constants; keep the compiled cache
+# large enough that they are not evicted by one-off queries (default 500).
+# Connections are pooled and reused across requests (QueuePool).
+engine = create_engine(
+    settings.database_url,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    query_cache_size=1200,
+    connect_args=connect_args,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
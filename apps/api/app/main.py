@@ -1,14 +1,35 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import configure_mappers
 
 from app.core.config import settings
+from app.core.security import create_access_token, dummy_password_hash, verify_and_update
 from app.api.router import api_router
 from app.api.routes import auth
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pay one-time setup at startup instead of on the first request:
+    # the Argon2 hasher and login's dummy hashes (Argon2 and legacy bcrypt),
+    # the cached JWT header/HMAC key, and SQLAlchemy mapper configuration.
+    verify_and_update("warmup", dummy_password_hash())
+    create_access_token("0", settings.API_SECRET_KEY, 1)
+    configure_mappers()
+    yield
+
+
 app = FastAPI(
     title="Locksum API",
     version="0.0.1",
     root_path="/api",
+    lifespan=lifespan,
+    # response_model output is already JSON-safe (Decimal -> str) by the time
+    # it reaches the response class; orjson just encodes it much faster.
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -19,9 +40,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.get("/health")
-def health():
-    return {"status": "ok"}
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
+async def health(request: Request) -> Response:
+    # Plain Starlette route: no dependency resolution, validation or JSON
+    # encoding. A fresh Response per call because middleware (CORS) appends
+    # to the response's header list in place.
+    return Response(_HEALTH_BODY, media_type="application/json")
+
+
+app.add_route("/health", health, methods=["GET"])
 
 
 app.include_router(api_router)    
@@ -0,0 +1,21 @@
+from app.db.base import Base
+
+from app.models.user import User
+from app.models.company import Company
+from app.models.membership import Membership
+from app.models.customer import Customer
+from app.models.item import Item
+from app.models.invoice import Invoice
+from app.models.invoice_line import InvoiceLine
+
+
+__all__ = [
+    "Base",
+    "User",
+    "Company",
+    "Membership",
+    "Customer",
+    "Item",
+    "Invoice",
+    "InvoiceLine",
+]
@@ -1,14 +0,0 @@
-from app.db.base import Base
-
-from app.models.user import User  
-from app.models.company import Company  
-from app.models.membership import Membership  
-from app.models.customer import Customer 
-from app.models.item import Item
-from .invoice import Invoice
-from .invoice_line import InvoiceLine
-
-
-
-
-__all__ = ["User", "Company", "Membership"]
@@ -1,8 +1,9 @@
+import uuid
 from datetime import datetime
-from uuid import uuid4
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Numeric, String, Text, func, text
+from sqlalchemy.dialects.postgresql import UUID
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,11 +12,17 @@ from app.db.base import Base
 
 class Invoice(Base):
     __tablename__ = "invoices"
+    __table_args__ = (
+        # list_invoices: WHERE company_id = ? ORDER BY created_at DESC
+        Index("ix_invoices_company_created", "company_id", "created_at"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
-    company_id: Mapped[str] = mapped_column(String(36), ForeignKey("companies.id"), index=True, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    company_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("companies.id"), nullable=False)
 
-    customer_id: Mapped[str] = mapped_column(String(36), ForeignKey("customers.id"), index=True, nullable=False)
+    customer_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("customers.id"), index=True, nullable=False)
 
     # human-friendly invoice number (optional but useful)
     number: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -37,5 +44,15 @@ class Invoice(Base):
     )
 
     # relationships
-    lines = relationship("InvoiceLine", back_populates="invoice", cascade="all, delete-orphan")
-    customer = relationship("Customer")
\ No newline at end of file
+    # lazy="raise": an implicit per-row load here is an N+1 waiting to happen on
+    # list endpoints, so callers must opt in with selectinload().
+    # passive_deletes: the FK's ON DELETE CASCADE removes lines, so deleting an
+    # invoice does not load them first.
+    lines = relationship(
+        "InvoiceLine",
+        back_populates="invoice",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
+    customer = relationship("Customer", lazy="raise")
\ No newline at end of file
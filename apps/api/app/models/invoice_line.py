@@ -1,7 +1,8 @@
-from uuid import uuid4
+import uuid
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Numeric, String, Text
+from sqlalchemy import BigInteger, Computed, ForeignKey, Index, Numeric, Text, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -9,17 +10,26 @@ from app.db.base import Base
 
 class InvoiceLine(Base):
     __tablename__ = "invoice_lines"
+    __table_args__ = (
+        # Covers the totals SUM as an index-only scan, for both the numeric and
+        # the *_cents variant (see INVOICE_TOTALS_FROM_CENTS).
+        Index(
+            "ix_invoice_lines_invoice_id_incl",
+            "invoice_id",
+            postgresql_include=["quantity", "unit_price", "quantity_cents", "unit_price_cents"],
+        ),
+    )
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
     )
 
-    invoice_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("invoices.id"), nullable=False, index=True
+    invoice_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("invoices.id", ondelete="CASCADE"), nullable=False
     )
 
-    item_id: Mapped[str | None] = mapped_column(
-        String(36), ForeignKey("items.id"), nullable=True
+    item_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("items.id"), nullable=True
     )
 
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -32,4 +42,14 @@ class InvoiceLine(Base):
         Numeric(12, 2), nullable=False
     )
 
+    # Integer-cent mirrors maintained by Postgres, so totals can be summed with
+    # native bigint math instead of numeric (see INVOICE_TOTALS_FROM_CENTS).
+    quantity_cents: Mapped[int] = mapped_column(
+        BigInteger, Computed("(quantity * 100)::bigint", persisted=True), nullable=False
+    )
+
+    unit_price_cents: Mapped[int] = mapped_column(
+        BigInteger, Computed("(unit_price * 100)::bigint", persisted=True), nullable=False
+    )
+
     invoice = relationship("Invoice", back_populates="lines")
\ No newline at end of file
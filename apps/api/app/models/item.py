@@ -1,8 +1,10 @@
+import uuid
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
-from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String, Text, func, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -15,15 +17,17 @@ class Item(Base):
     """
     __tablename__ = "items"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
-    company_id: Mapped[str] = mapped_column(String(36), ForeignKey("companies.id"), index=True, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    company_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("companies.id"), index=True, nullable=False)
 
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     sku: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Money: use Numeric to avoid float issues
-    unit_price: Mapped[str] = mapped_column(Numeric(12, 2), nullable=False, server_default="0.00")
+    unit_price: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, server_default="0.00")
 
     taxable: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
     active: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="true")
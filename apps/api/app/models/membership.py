@@ -1,4 +1,7 @@
-from sqlalchemy import ForeignKey, String
+import uuid
+
+from sqlalchemy import ForeignKey, String, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -7,9 +10,11 @@ from app.db.base import Base
 class Membership(Base):
     __tablename__ = "memberships"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)  # UUID string
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    company_id: Mapped[str] = mapped_column(String(36), ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    company_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
 
     role: Mapped[str] = mapped_column(String(50), default="owner", nullable=False)
 
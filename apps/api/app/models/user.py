@@ -1,5 +1,7 @@
+import uuid
 from datetime import datetime
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, func, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -8,7 +10,9 @@ from app.db.base import Base
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)  # store UUID as string
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
     email: Mapped[str] = mapped_column(String(320), unique=True, index=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
 
@@ -18,3 +22,10 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     memberships = relationship("Membership", back_populates="user", cascade="all, delete-orphan")
+
+
+# Case-insensitive uniqueness, so rows written before emails were normalized
+# cannot collide by case. Lookups compare User.email directly (routes store
+# and query lower-cased emails) and are served by ix_users_email, which is
+# kept for that; this index only enforces uniqueness on lower(email).
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
@@ -1,44 +1,70 @@
-from decimal import Decimal
-from sqlalchemy import select
+from uuid import UUID
+
+from sqlalchemy import Numeric, bindparam, cast, func, select, update
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.invoice import Invoice
 from app.models.invoice_line import InvoiceLine
 
 
-def recalc_invoice_totals(db: Session, invoice_id: str) -> Invoice:
-    """
-    Recalculate invoice subtotal, tax, and total from invoice lines.
-    Uses snapshot values stored on InvoiceLine.
-    """
+def _recalc_statement(line_subtotal):
+    # Aggregate without GROUP BY: always exactly one row, even for an invoice
+    # with no lines, so the sum is computed once. The invoice id is carried
+    # through the subquery to give the UPDATE ... FROM a real join condition.
+    invoice_id = bindparam("invoice_id", type_=Invoice.__table__.c.id.type)
+    line_sums = (
+        select(
+            invoice_id.label("invoice_id"),
+            func.coalesce(line_subtotal, 0).label("subtotal"),
+        )
+        .where(InvoiceLine.invoice_id == invoice_id)
+        .subquery()
+    )
+    tax_total = func.round(line_sums.c.subtotal * Invoice.tax_rate, 2)
 
-    invoice = db.execute(
-        select(Invoice).where(Invoice.id == invoice_id)
-    ).scalars().first()
+    return (
+        update(Invoice)
+        .where(Invoice.id == line_sums.c.invoice_id)
+        .values(
+            subtotal=line_sums.c.subtotal,
+            tax_total=tax_total,
+            total=line_sums.c.subtotal + tax_total,
+        )
+        .returning(Invoice)
+        .execution_options(populate_existing=True, synchronize_session=False)
+    )
 
-    if not invoice:
-        raise ValueError("Invoice not found")
 
-    lines = db.execute(
-        select(InvoiceLine).where(InvoiceLine.invoice_id == invoice_id)
-    ).scalars().all()
+# Built once at import so the compiled form is reused from the statement cache.
+RECALC_INVOICE_TOTALS = _recalc_statement(
+    func.sum(InvoiceLine.quantity * InvoiceLine.unit_price)
+)
+# Same result from bigint math: cents * cents is in 1/10000ths, converted to
+# numeric once per invoice instead of once per line.
+RECALC_INVOICE_TOTALS_FROM_CENTS = _recalc_statement(
+    cast(func.sum(InvoiceLine.quantity_cents * InvoiceLine.unit_price_cents), Numeric) / 10000
+)
 
-    subtotal = Decimal("0.00")
 
-    for line in lines:
-        qty = Decimal(str(line.quantity))
-        price = Decimal(str(line.unit_price))
-        subtotal += qty * price
+def recalc_invoice_totals(db: Session, invoice_id: UUID) -> Invoice:
+    """
+    Recalculate invoice subtotal, tax, and total from invoice lines.
+    Uses snapshot values stored on InvoiceLine.
 
-    tax_rate = Decimal(str(invoice.tax_rate or 0))
-    tax_total = (subtotal * tax_rate).quantize(Decimal("0.01"))
-    total = (subtotal + tax_total).quantize(Decimal("0.01"))
+    Done as a single UPDATE ... FROM (SELECT SUM(...)) ... RETURNING so the
+    lines never leave the database; the returned row refreshes the Invoice
+    already in the session.
+    """
 
-    invoice.subtotal = subtotal
-    invoice.tax_total = tax_total
-    invoice.total = total
+    # Pending edits (new/deleted lines, tax_rate) must be visible to the UPDATE.
+    db.flush()
 
-    db.add(invoice)
-    db.flush()  # no commit here (caller controls transaction)
+    # no commit here (caller controls transaction)
+    stmt = RECALC_INVOICE_TOTALS_FROM_CENTS if settings.INVOICE_TOTALS_FROM_CENTS else RECALC_INVOICE_TOTALS
+    invoice = db.execute(stmt, {"invoice_id": invoice_id}).scalar_one_or_none()
+
+    if not invoice:
+        raise ValueError("Invoice not found")
 
     return invoice